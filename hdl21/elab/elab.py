@@ -13,10 +13,15 @@ from typing import List, Optional, TypeVar
 from .elaboratable import Elaboratable, Elaboratables, is_elaboratable
 from .context import Context
 from .elabpass import ElabPass
+from .elaborators import FusedElaborator
 
 
 ElaboratableType = TypeVar("ElaboratableType", bound=Elaboratable)
 
+# Default `Context`, shared by all calls to `elaborate` which do not provide one.
+# `Context` carries no per-instance state, and no elaboration pass modifies it.
+_DEFAULT_CTX = Context()
+
 
 def elaborate(
     top: ElaboratableType,
@@ -31,20 +36,34 @@ def elaborate(
 
     Optional `passes` lists the ordered `ElabPass`es to run. By default it runs the order specified by `ElabPass.default`.
     Note the order of passes is important; many depend upon others to have completed before they can successfully run.
+    Consecutive built-in `ElabPass`es which support it are fused into a single depth-first traversal of the hierarchy,
+    in which each Module runs each pass in order, after all of its children have completed them all.
+    Any other (e.g. user-defined) `Elaborator` passes are run separately, over the entire hierarchy.
 
     Optional `Context` field `ctx` is not yet supported.
     """
 
     # Expand default values
-    ctx = ctx or Context()
+    ctx = ctx or _DEFAULT_CTX
     passes = passes or ElabPass.default()
 
     # Check whether we are elaborating a single object or a list thereof
     tops: List[Elaboratable] = top if isinstance(top, List) else [top]
 
-    # Pass `tops` through each of our passes, in order
+    # Pass `tops` through each of our passes, in order.
+    # Consecutive built-in passes which can be fused are run together, in a single traversal of the hierarchy.
+    # Only `ElabPass` members are fused; other passes have not been audited for its requirements.
+    fused: List[type] = list()
     for elabpass in passes:
+        if isinstance(elabpass, ElabPass) and FusedElaborator.fusable(elabpass.value):
+            fused.append(elabpass.value)
+            continue
+        if fused:
+            tops = FusedElaborator.elaborate(passes=fused, tops=tops, ctx=ctx)
+            fused = list()
         tops = elabpass.elaborate(tops=tops, ctx=ctx)
+    if fused:
+        tops = FusedElaborator.elaborate(passes=fused, tops=tops, ctx=ctx)
 
     # Extract the single-element case
     if not isinstance(top, List):
@@ -13,3 +13,4 @@ from .portrefs import ResolvePortRefs
 from .conntypes import ConnTypes
 from .flatten_bundles import BundleFlattener
 from .mark_modules import MarkModules
+from .fused import FusedElaborator
@@ -6,7 +6,7 @@
 # Std-Lib Imports
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Container, Dict, List, Optional, Set, Union
 
 # Local imports
 from ...module import Module
@@ -52,6 +52,24 @@ class Elaborator:
         self.tops = tops
         self.ctx = ctx
         self.stack: List[ElabStackEntry] = list()
+        # Cache of Modules elaborated by this pass, keyed by their `id`
+        self.modules: Dict[int, Module] = dict()
+        # Dispatch from Instance-target types to the methods which elaborate them
+        self.dispatch: Dict[type, Callable[[Instantiable], Instantiable]] = {
+            Module: self.elaborate_module_base,  # Note `_base` here!
+            PrimitiveCall: self.elaborate_primitive_call,
+            ExternalModuleCall: self.elaborate_external_module,
+        }
+        # Leaf Instance-target types which this pass leaves unmodified, and can skip entirely.
+        # Includes `PrimitiveCall`s and `ExternalModuleCall`s, unless the pass overrides their methods.
+        self.passthrough: Set[type] = {
+            tp
+            for tp, method in (
+                (PrimitiveCall, "elaborate_primitive_call"),
+                (ExternalModuleCall, "elaborate_external_module"),
+            )
+            if getattr(type(self), method) is getattr(Elaborator, method)
+        }
 
     def elaborate_tops(self) -> List[Elaboratable]:
         """Elaborate our top nodes"""
@@ -91,6 +109,9 @@ class Elaborator:
         # Check if this has already been elaborated
         if module._elaborated is not None:
             return module._elaborated
+        # Or if it has already been elaborated by this pass, e.g. as the target of another Instance
+        if id(module) in self.modules:
+            return self.modules[id(module)]
 
         self.stack.append(module)
 
@@ -106,8 +127,9 @@ class Elaborator:
         for bundle in module.bundles.values():
             self.elaborate_bundle_instance(bundle)
 
-        # Run the pass-specific `elaborate_module`
+        # Run the pass-specific `elaborate_module`, and cache its result
         result = self.elaborate_module(module)
+        self.modules[id(module)] = result
 
         # Pop the hierarchy-stack and return it
         self.stack.pop()
@@ -134,31 +156,41 @@ class Elaborator:
     def elaborate_instance_base(self, inst: _Instance) -> Instantiable:
         """Elaborate a Module Instance, Array or Bundle thereof."""
 
-        self.stack.append(inst)
         # Turn off `PortRef` magic
         inst._elaborated = True
-        # And visit the Instance's target
-        rv = self.elaborate_instantiable(inst._resolved)
+
+        # If the Instance's target has already been elaborated by this pass,
+        # or is a leaf which this pass does not modify, we're done
+        of = inst._resolved
+        if id(of) in self.modules:
+            return self.modules[id(of)]
+        if type(of) in self.passthrough:
+            return of
+
+        # Otherwise visit the Instance's target
+        self.stack.append(inst)
+        rv = self.elaborate_instantiable(of)
         self.stack.pop()
         return rv
 
     def elaborate_instantiable(self, of: Instantiable) -> Instantiable:
-        # This version of `elaborate_instantiable` is the "post-generators" version used by *most* passes.
-        # The Generator-elaborator is different, and overrides it.
+        # Dispatch on the exact type of `of`, via `self.dispatch`.
+        # The Generator-elaborator adds `GeneratorCall`s to it; for all other passes they are invalid here.
+        func = self.dispatch.get(type(of), None)
+        if func is not None:
+            return func(of)
         if not of:
             self.fail(f"Error elaborating undefined Instance-target {of}")
-        if isinstance(of, Module):
-            return self.elaborate_module_base(of)  # Note `_base` here!
-        if isinstance(of, PrimitiveCall):
-            return self.elaborate_primitive_call(of)
-        if isinstance(of, ExternalModuleCall):
-            return self.elaborate_external_module(of)
-        raise TypeError
+        raise TypeError(f"Invalid Instance-target {of}")
 
     def flatname(
-        self, segments: List[str], *, avoid: Optional[Dict] = None, maxlen: int = 511
+        self,
+        segments: List[str],
+        *,
+        avoid: Optional[Container[str]] = None,
+        maxlen: int = 511,
     ) -> str:
-        """Create a attribute-name merging string-list `segments`, while avoiding all keys in dictionary `avoid`.
+        """Create a attribute-name merging string-list `segments`, while avoiding all names in `avoid`, commonly a namespace dictionary or set.
         Commonly re-used while flattening  nested objects and while creating explicit attributes from implicit ones.
         Raises a `RunTimeError` if no such name can be found of length less than `maxlen`.
         The default max-length is 511 characters, a value representative of typical limits in target EDA formats."""
@@ -167,15 +199,15 @@ class Elaborator:
             avoid = {}
 
         # The default format and result is of the form "seg0_seg1".
-        # If that is in the avoid-keys, append underscores until it's not, or fails.
+        # If that is in the avoid-keys, append underscores until it's not.
         name = "_".join(segments)
-        while True:
-            if len(name) > maxlen:
-                msg = f"Could not generate a flattened name for {segments}: (trying {name})"
-                self.fail(msg)
-            if name not in avoid:  # Done!
-                break
+        while name in avoid:
             name += "_"  # Collision; append underscore
+
+        # Since each collision only lengthens the name, checking its length once at the end suffices.
+        if len(name) > maxlen:
+            msg = f"Could not generate a flattened name for {segments}: (trying {name})"
+            self.fail(msg)
         return name
 
     def fail(self, msg: str):
@@ -4,11 +4,9 @@
 
 # Std-Lib Imports
 import copy
-from dataclasses import field
-from typing import Dict, List, Union, Optional
-
-# PyPi
-from pydantic.dataclasses import dataclass
+from itertools import chain
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple, Union, Optional
 
 # Local imports
 from ...module import Module
@@ -92,9 +90,6 @@ class BundleScope:
             self.signals[path_from_self] = sig
 
 
-BundleScope.__pydantic_model__.update_forward_refs()
-
-
 @dataclass
 class BundlePortEntry:
     """# Bundle-Port Entry in the Cache
@@ -138,6 +133,14 @@ THE_CACHE = Cache()
 class BundleFlattener(Elaborator):
     """Bundle-Flattening Elaborator Pass"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Flattened "template" scopes per Bundle definition.
+        # Keyed by the Bundle's identity, plus the instance-level attributes which affect flattening:
+        # port-ness, flip-state, and (the identity of) its role.
+        # Each `BundleInstance` gets a fresh copy of its template's Signals.
+        self.flat_templates: Dict[Tuple[int, bool, bool, int], BundleScope] = dict()
+
     def elaborate_module(self, module: Module) -> Module:
         """Flatten Module `module`s Bundles, replacing them with newly-created Signals.
         Reconnect the flattened Signals to any Instances connected to said Bundles."""
@@ -145,31 +148,40 @@ class BundleFlattener(Elaborator):
         # Cache the state of the Module's IOs before flattening
         module._pre_flattening_io = copy.copy(io(module))
 
+        # Names for flattened Signals must avoid everything in the Module namespace.
+        # Track them in a local set, which grows as each new name is chosen.
+        avoid = set(module.namespace)
+
         # Remove and replace each `BundleInstance` from the Module
         while module.bundles:
             name, bundle_inst = module.bundles.popitem()
             module.namespace.pop(name)
-            self.replace_bundle_inst(module, bundle_inst)
+            avoid.discard(name)
+            self.replace_bundle_inst(module, bundle_inst, avoid)
 
         # Go through each Instance, replacing `AnonymousBundle`s with their referents
         # Note `Module`s do not store `AnonymousBundle`s directly, so we don't have a quicker way
         # to find them all than traversing the connections to each instance and array.
-        for inst in instances_and_arrays(module):
-            anon_conns = {
-                portname: conn
-                for portname, conn in inst.conns.items()
-                if isinstance(conn, AnonymousBundle)
-            }
-            for portname, anon_bundle in anon_conns.items():
-                self.replace_anon_bundle_conn(
-                    inst=inst, portname=portname, anon=anon_bundle
-                )
+        # Collect them all in a single pass, before any replacement modifies the `conns`.
+        anon_conns = [
+            (inst, portname, conn)
+            for inst in instances_and_arrays(module)
+            for portname, conn in inst.conns.items()
+            if isinstance(conn, AnonymousBundle)
+        ]
+        for inst, portname, anon_bundle in anon_conns:
+            self.replace_anon_bundle_conn(
+                inst=inst, portname=portname, anon=anon_bundle
+            )
 
         return module
 
-    def replace_bundle_inst(self, module: Module, bundle_inst: BundleInstance):
+    def replace_bundle_inst(
+        self, module: Module, bundle_inst: BundleInstance, avoid: Set[str]
+    ):
         """Replace a `BundleInstance`, flattening its Signals into `module`'s namespace,
-        and replacing all of its Instance connections with their flattened replacements."""
+        and replacing all of its Instance connections with their flattened replacements.
+        Flattened names avoid, and are added to, the set of names `avoid`."""
 
         # Check we haven't (somehow) already replaced it
         if id(bundle_inst) in THE_CACHE.bundle_insts:
@@ -179,14 +191,15 @@ class BundleFlattener(Elaborator):
         # Flatten it
         flat = self.flatten_bundle_inst(bundle_inst, path=Path([]))
 
-        # Add each flattened Signal. Note flattened Signals are modified in-place.
+        # Name each flattened Signal, prepending the bundle-instance's name.
+        # Note flattened Signals are modified in-place.
         for pathstr, sig in flat.signals.items():
-            # Rename the signal, prepending the bundle-instance's name
             sig.name = self.flatname(
-                segments=[bundle_inst.name, pathstr.to_name()],
-                avoid=module.namespace,
+                segments=[bundle_inst.name, pathstr.to_name()], avoid=avoid
             )
-            # And add it to the Module namespace
+            avoid.add(sig.name)
+        # And add them all to the Module namespace
+        for sig in flat.signals.values():
             module.add(sig)
 
         # Store the result in our caches
@@ -206,12 +219,22 @@ class BundleFlattener(Elaborator):
         self.resolve_bundlerefs(bundle_inst)
 
     def resolve_bundlerefs(self, hasrefs: Union[BundleInstance, BundleRef]) -> None:
-        """Resolve all BundleRefs that `hasrefs` has given out."""
-        for bref in hasrefs.refs_to_me.values():
-            # Recursively get references it has handed out
-            self.resolve_bundlerefs(bref)
-            # And resolve `bref` itself
-            self.resolve_bundleref(bref)
+        """Resolve all BundleRefs that `hasrefs` has given out.
+        Traverses nested references with an explicit stack, resolving each reference after those it has handed out."""
+
+        # Stack of `(bref, expanded)` pairs, where `expanded` indicates its children have already been pushed
+        stack = [(bref, False) for bref in reversed(list(hasrefs.refs_to_me.values()))]
+        while stack:
+            bref, expanded = stack.pop()
+            if expanded:
+                # Its references are done. Resolve `bref` itself.
+                self.resolve_bundleref(bref)
+                continue
+            # Push `bref` back, followed by the references it has handed out, which pop first.
+            stack.append((bref, True))
+            stack.extend(
+                (child, False) for child in reversed(list(bref.refs_to_me.values()))
+            )
 
     def replace_bundle_conn(self, inst: Instance, portname: str, flat: BundleScope):
         """
@@ -287,14 +310,26 @@ class BundleFlattener(Elaborator):
         self, bundle_inst: BundleInstance, path: Path
     ) -> BundleScope:
         """# Flatten a bundle instance"""
-        # Kick off recursive flattening
-        return self.flatten_bundle_inst_helper(
-            bundle_inst=bundle_inst,
-            path=path,
-            is_this_top_level=True,
-            is_port=bundle_inst.port,
-            flip_state=bundle_inst.flipped,
+        key = (
+            id(bundle_inst.of),
+            bundle_inst.port,
+            bundle_inst.flipped,
+            id(bundle_inst.role),
         )
+        template = self.flat_templates.get(key, None)
+        if template is None:
+            # Kick off recursive flattening
+            template = self.flatten_bundle_inst_helper(
+                bundle_inst=bundle_inst,
+                path=path,
+                is_this_top_level=True,
+                is_port=bundle_inst.port,
+                flip_state=bundle_inst.flipped,
+            )
+            self.flat_templates[key] = template
+
+        # Copy the template, with fresh Signals, sourced from `bundle_inst`
+        return copy_scope(template, src=bundle_inst, memo=dict())
 
     def flatten_bundle_inst_helper(
         self,
@@ -314,7 +349,7 @@ class BundleFlattener(Elaborator):
             signal_path = Path([sig.name])
             if signal_path in scope.signals:
                 self.fail(f"Doubly defined Signal {sig} in {bundle_inst}")
-            newsig = copy.deepcopy(sig)
+            newsig = sig.clone()
             newsig.name = signal_path.to_name()
 
             # Sort out the new Signal's visibility and direction
@@ -471,9 +506,31 @@ class BundleFlattener(Elaborator):
         return ns
 
 
-def instances_and_arrays(module: Module) -> List[Instance]:
-    """Get a list of `module`'s instances and instance arrays."""
-    return list(module.instances.values()) + list(module.instarrays.values())
+def copy_scope(
+    scope: BundleScope,
+    src: Union[BundleInstance, AnonymousBundle],
+    memo: Dict[int, Signal],
+) -> BundleScope:
+    """Copy `scope`, replacing each of its Signals with a copy.
+    Signals shared between a scope and its sub-scopes remain shared, via `memo`,
+    a dictionary from the id of each original Signal to its copy."""
+
+    new = BundleScope(src=src)
+    for path, sig in scope.signals.items():
+        newsig = memo.get(id(sig), None)
+        if newsig is None:
+            newsig = memo[id(sig)] = sig.clone()
+        new.signals[path] = newsig
+    for path, subscope in scope.scopes.items():
+        new_subscope = copy_scope(subscope, src=subscope.src, memo=memo)
+        new_subscope.parent = new
+        new.scopes[path] = new_subscope
+    return new
+
+
+def instances_and_arrays(module: Module) -> Iterable[Instance]:
+    """Iterate over `module`'s instances and instance arrays, without copying either."""
+    return chain(module.instances.values(), module.instarrays.values())
 
 
 __all__ = ["BundleFlattener"]
@@ -0,0 +1,97 @@
+"""
+# Fused Elaborator
+"""
+
+# Std-Lib Imports
+from typing import List, Set, Type
+
+# Local imports
+from ...module import Module
+
+from ..elaboratable import Elaboratable
+from ..context import Context
+
+# Import the base class
+from .base import Elaborator, ElabStackEntry
+
+
+class FusedElaborator:
+    """
+    # Fused Elaborator
+
+    Runs a sequence of `Elaborator` passes in a single depth-first traversal of the hierarchy.
+    Each `Module` is visited once, after all of the Modules it instantiates,
+    and has each pass run on it in order.
+
+    This produces the same result as running each pass over the whole hierarchy in turn,
+    so long as each pass's `elaborate_module` depends only on its own Module,
+    and on child Modules which have completed *all* passes.
+    The passes in `ElabPass`, other than `RUN_GENERATORS`, are designed to meet this requirement.
+    """
+
+    @staticmethod
+    def fusable(elaborator: type) -> bool:
+        """Boolean indication of whether `elaborator` can be fused.
+        Passes which override `elaborate_tops`, e.g. by changing the top-level objects, cannot.
+        Note this does not check the per-Module requirements described above;
+        callers are responsible for only fusing passes which meet them, e.g. those in `ElabPass`."""
+        return (
+            isinstance(elaborator, type)
+            and issubclass(elaborator, Elaborator)
+            and elaborator.elaborate_tops is Elaborator.elaborate_tops
+        )
+
+    @classmethod
+    def elaborate(
+        cls,
+        passes: List[Type[Elaborator]],
+        tops: List[Elaboratable],
+        ctx: Context,
+    ) -> List[Elaboratable]:
+        """Elaboration entry-point. Elaborate the top-level objects with each of `passes`."""
+        return cls(passes, tops, ctx).elaborate_tops()
+
+    def __init__(
+        self,
+        passes: List[Type[Elaborator]],
+        tops: List[Elaboratable],
+        ctx: Context,
+    ):
+        self.tops = tops
+        self.elaborators: List[Elaborator] = [p(tops, ctx) for p in passes]
+        self.path: List[ElabStackEntry] = list()  # Hierarchy path to the current Module
+        self.visited: Set[int] = set()  # Set of visited Module ids
+
+    def elaborate_tops(self) -> List[Elaboratable]:
+        """Elaborate our top nodes"""
+        if not isinstance(self.tops, List):
+            self.elaborators[0].fail(
+                f"Invalid Top for Elaboration: {self.tops} must be a list"
+            )
+        for t in self.tops:
+            self.visit_module(t)
+        return self.tops
+
+    def visit_module(self, module: Module) -> None:
+        """Visit `module`: first each of the Modules it instantiates, then `module` itself with each pass."""
+
+        if module._elaborated is not None or id(module) in self.visited:
+            return  # Already done
+        self.visited.add(id(module))
+
+        # Depth-first traverse instances, arrays, and bundles thereof
+        self.path.append(module)
+        for insts in (module.instances, module.instarrays, module.instbundles):
+            for inst in insts.values():
+                target = inst._resolved
+                if isinstance(target, Module):
+                    self.path.append(inst)
+                    self.visit_module(target)
+                    self.path.pop()
+        self.path.pop()
+
+        # Run each pass on `module`.
+        # Its child Modules are all now cached by each pass, so this does not recurse further.
+        for elaborator in self.elaborators:
+            elaborator.stack = list(self.path)
+            elaborator.elaborate_module_base(module)
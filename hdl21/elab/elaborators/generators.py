@@ -2,12 +2,12 @@
 # Generator Elaborator 
 """
 
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Tuple, Union
 
 # Local imports
 from ...module import Module
 from ...instance import Instance
-from ...generator import GeneratorCall
+from ...generator import Generator, GeneratorCall
 from ...params import HasNoParams, _unique_name
 from ...instantiable import Instantiable
 
@@ -16,8 +16,18 @@ from .base import Elaborator
 
 
 # Cache GeneratorCalls to their (Module) results
-# (Yes, GeneratorCalls can be hashed.)
-THE_GENERATOR_CALL_CACHE: Dict[GeneratorCall, Module] = dict()
+# Keyed by `_cache_key`, a cheap-to-hash tuple of the Generator and its parameters' unique name.
+# Unique names are not strictly unique, e.g. `None` and `"None"` produce the same one.
+# So each key maps to a list of `(params, Module)` pairs, which are checked for parameter-equality.
+THE_GENERATOR_CALL_CACHE: Dict[Tuple[Generator, str], List[Tuple[Any, Module]]] = dict()
+
+
+def _cache_key(call: GeneratorCall) -> Tuple[Generator, str]:
+    """Get the cache-key for `call`: a tuple of its Generator and its parameters' unique name.
+    Computed once per call, and stored on the call thereafter."""
+    if call._cache_key is None:
+        call._cache_key = (call.gen, _unique_name(call.params))
+    return call._cache_key
 
 
 class GeneratorElaborator(Elaborator):
@@ -37,6 +47,11 @@ class GeneratorElaborator(Elaborator):
     and `GeneratorElaborator`'s special-ish case is left to over-ride it.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add the capacity to call `GeneratorCall`s to the more-common base-case dispatch
+        self.dispatch[GeneratorCall] = self.elaborate_generator_call
+
     def elaborate_tops(self) -> List[Module]:
         """Elaborate our top nodes"""
         if not isinstance(self.tops, List):
@@ -58,17 +73,10 @@ class GeneratorElaborator(Elaborator):
     def elaborate_generator_call(self, call: GeneratorCall) -> Module:
         """Elaborate Generator-function-call `call`. Returns the generated Module."""
 
-        # First and foremost - caching.
-        # See if we've already run this generator-parameters combo.
-        # We store this both in the module-scope cache, and on the Call itself.
-        # If the two are different Modules... not sure what would cause that, but fail.
-        global THE_GENERATOR_CALL_CACHE
-        cached_result = THE_GENERATOR_CALL_CACHE.get(call, None)
-        if cached_result is not None:
-            if call.result is not None and call.result is not cached_result:
-                msg = f"GeneratorCall {call} has two different results: {call.result} and {cached_result}"
-                self.fail(msg)
-            call.result = cached_result
+        # Fast path: this very Call object has already been elaborated.
+        # Its `result` then serves as an identity-keyed cache, requiring no lookups at all.
+        # Note the `_cache_key` is only set here during elaboration.
+        if call.result is not None and call._cache_key is not None:
             return call.result
 
         # Add both the `Call` and `Generator` to our stack.
@@ -80,6 +88,26 @@ class GeneratorElaborator(Elaborator):
             msg = f"Invalid Generator Call {call}: {call.gen.Params} instance required, got {call.params}"
             self.fail(msg)
 
+        # Next - caching by value.
+        # See if we've already run this generator-parameters combo, e.g. from another equal Call.
+        # We store this both in the module-scope cache, and on the Call itself.
+        # If the two are different Modules... not sure what would cause that, but fail.
+        global THE_GENERATOR_CALL_CACHE
+        key = _cache_key(call)
+        cached_result = None
+        for cached_params, cached_module in THE_GENERATOR_CALL_CACHE.get(key, []):
+            if cached_params == call.params:
+                cached_result = cached_module
+                break
+        if cached_result is not None:
+            if call.result is not None and call.result is not cached_result:
+                msg = f"GeneratorCall {call} has two different results: {call.result} and {cached_result}"
+                self.fail(msg)
+            call.result = cached_result
+            self.stack.pop()
+            self.stack.pop()
+            return call.result
+
         # The main event: Run the generator-function
         try:
             if call.gen.usecontext:
@@ -103,7 +131,7 @@ class GeneratorElaborator(Elaborator):
             # Then add a unique suffix per its parameter-values
             # Note this part may require that `m` has been through elaboration above!
             if not isinstance(call.params, HasNoParams):
-                m.name += "(" + _unique_name(call.params) + ")"
+                m.name += "(" + key[1] + ")"
 
         # Generators may return other (potentially nested) generator-calls; recursively unwind any of them
         # Note this should hit Python's recursive stack-check if it doesn't terminate
@@ -119,7 +147,7 @@ class GeneratorElaborator(Elaborator):
 
         # Store the result in our cache, and on the Call.
         call.result = m
-        THE_GENERATOR_CALL_CACHE[call] = m
+        THE_GENERATOR_CALL_CACHE.setdefault(key, []).append((call.params, m))
 
         # Pop both the `Call` and `Generator` off the stack
         self.stack.pop()
@@ -133,16 +161,19 @@ class GeneratorElaborator(Elaborator):
         # This version differs from `Elaborator` in operating on the *unresolved* attribute `inst.of`,
         # instead of the resolved version `inst._resolved`.
 
-        self.stack.append(inst)
         # Turn off `PortRef` magic
         inst._elaborated = True
-        # And visit the Instance's target
+
+        # If the Instance's target has already been generated and elaborated by this pass,
+        # or is a leaf which this pass does not modify, we're done
+        of = inst._resolved
+        if id(of) in self.modules:
+            return self.modules[id(of)]
+        if type(of) in self.passthrough:
+            return of
+
+        # Otherwise visit the Instance's target
+        self.stack.append(inst)
         rv = self.elaborate_instantiable(inst.of)
         self.stack.pop()
         return rv
-
-    def elaborate_instantiable(self, of: Instantiable) -> Instantiable:
-        """Elaborate an Instance target. Adds the capacity to call `GeneratorCall`s to the more-common base-case."""
-        if isinstance(of, GeneratorCall):
-            return self.elaborate_generator_call(call=of)
-        return super().elaborate_instantiable(of)
@@ -18,3 +18,4 @@ class MarkModules(Elaborator):
         # and not just a boolean, in case we want to
         # have differences between the two some day.
         module._elaborated = module
+        return module
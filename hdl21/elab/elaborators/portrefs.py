@@ -5,19 +5,18 @@ Creates concrete `Signal`s and `BundleInstance`s to replace `PortRef`s.
 """
 
 # Std-Lib Imports
-import copy
-from typing import Union, List, Optional, Dict
+from typing import Any, Dict, Hashable, List, Optional, Union
 
 # Local imports
 from ...connect import Connectable
 from ...instance import _get_connref
-from ...instantiable import io
 from ...module import Module
 from ...portref import PortRef
 from ...bundle import BundleInstance, BundleRef, AnonymousBundle
 from ...signal import PortDir, Signal, Visibility
 from ...noconn import NoConn
 from .resolve_ref_types import update_ref_deps
+from .conntypes import io_for_checking
 
 # Import the base class
 from .base import Elaborator
@@ -67,53 +66,48 @@ class ResolvePortRefs(Elaborator):
         )
 
         # Collect up all `PortRef`s for all instances in the module
-        # FIXME: move from SetList to a regular Set. Thus far breaks one test, somehow.
-        module_portrefs = SetList()
+        # Stored as an insertion-ordered dictionary with `None` values, i.e. an ordered set.
+        module_portrefs: Dict[PortRef, None] = dict()
         for inst in instancelike:
 
             # Populate the module-level set of PortRefs
             for portref in inst._refs.portrefs.values():
-                module_portrefs.add(portref)
+                module_portrefs[portref] = None
 
             # FIXME: add the `NoConn`s here, although it's not clear we *really* need these checks on them
             for portname, conn in inst.conns.items():
                 if isinstance(conn, NoConn):
-                    module_portrefs.add(_get_connref(inst, portname))
-
-        def follow(pref: PortRef, group: SetList) -> None:
-            """Closure to recursively follow `pref`, adding its outward and inward connections to `group`.
-            Removes encountered entries from `module_portrefs` along the way."""
-
-            if pref in group:
-                return  # Already done
-            if pref in module_portrefs:
-                module_portrefs.remove(pref)
-
-            # Add the portref to the group
-            group.add(pref)
-
-            # Add, and if necessary recursively follow, its instance connection
+                    module_portrefs[_get_connref(inst, portname)] = None
+
+        # Union each `PortRef` with everything it is connected to:
+        # its own Instance connection, and all other `PortRef`s connected to it.
+        # Each resulting disjoint set is a group of connected `PortRef`s, plus any `Source`s they connect to.
+        nets = DisjointSets()
+        for pref in module_portrefs:
+            nets.add(pref)
+
+        pending: List[PortRef] = list(module_portrefs)
+        followed = set()
+        while pending:
+            pref = pending.pop()
+            if pref in followed:
+                continue  # Already done
+            followed.add(pref)
+
+            # Union with its instance connection, and if necessary follow it
             conn = pref.inst.conns.get(pref.portname, None)
+            if conn is not None:
+                nets.union(pref, conn)
             if isinstance(conn, PortRef):
-                follow(conn, group)
-            else:  # Add ultimate signal `Source`s to the group
-                group.add(conn)
+                pending.append(conn)
 
-            # And recursively follow its connected ports
+            # And with its connected ports
             for connected_port in pref._connected_ports:
-                follow(connected_port, group)
+                nets.union(pref, connected_port)
+                pending.append(connected_port)
 
         # Collect groups of connected `PortRef`s
-        groups: List[List[Optional[Connectable]]] = list()
-
-        while module_portrefs:
-            # Create a new group, and recursively follow port refs to populate it
-            group = SetList()
-            follow(module_portrefs.pop(), group)
-
-            # Filter out the `None` entries before sticking in the `groups` list-of-lists.
-            group: List[Connectable] = [x for x in group.order if x is not None]
-            groups.append(group)
+        groups: List[List[Connectable]] = nets.groups()
 
         # For each group, find and/or create a Signal to replace all the PortRefs with.
         for group in groups:
@@ -205,29 +199,37 @@ class ResolvePortRefs(Elaborator):
 
     def create_source(self, module: Module, group: List[PortRef]) -> PortType:
         """Create a new `Signal`, parametrized and named to connect to the `PortRef`s in `group`."""
-        from ...instantiable import io
 
         # Sort out which PortRef to use for the new signal name.
-        portref = self.which_portref_to_name(group)
-
-        # Get its Module for its IO
         # Note if the other entries in `group` have incompatible IO, this will be flagged by a later pass.
-        ios = io(portref.inst._resolved)
-
+        portref = self.which_portref_to_name(group)
+        return self.add_port_copy(module, portref)
+
+    def add_port_copy(
+        self, module: Module, portref: PortRef, name: Optional[str] = None
+    ) -> PortType:
+        """Copy the port referred to by `portref` into a new internal `Signal` or `BundleInstance`, and add it to `module`.
+        The copy is named `name` if provided, or otherwise after the Instance and port names."""
+
+        # Get the target Module's port-object corresponding to `portref`.
+        # Note the target may have already been flattened, e.g. by a fused elaboration.
+        # In that case `io_for_checking` returns its IO from before flattening.
+        ios = io_for_checking(parent=module, i=portref.inst._resolved)
         port = ios.get(portref.portname, None)
-        if port is None:  # Clone it, and remove any Port-attributes
+        if port is None:
             msg = f"Invalid port `{portref.portname}` on Instance `{portref.inst.name}` in Module `{module.name}`"
             self.fail(msg)
 
         # Copy that port into an internal Signal / Bundle
         sig = self.copy_port(port)
 
-        # Rename it and add it to the Module namespace
-        signame = self.flatname(
-            segments=[f"{portref.inst.name}_{portref.portname}"],
-            avoid=module.namespace,
-        )
-        sig.name = signame
+        # Name it and add it to the Module namespace
+        if name is None:
+            name = self.flatname(
+                segments=[portref.inst.name, portref.portname],
+                avoid=module.namespace,
+            )
+        sig.name = name
         module.add(sig)
         return sig
 
@@ -236,7 +238,7 @@ class ResolvePortRefs(Elaborator):
 
         if isinstance(port, Signal):
             # Make a copy, and update its port-level visibility to internal
-            sig = copy.copy(port)
+            sig = port.clone()
             sig.vis = Visibility.INTERNAL
             sig.direction = PortDir.NONE
             return sig
@@ -261,72 +263,70 @@ class ResolvePortRefs(Elaborator):
     def replace_noconn(self, module: Module, portref: PortRef, noconn: NoConn):
         """Replace `noconn` with a newly minted `Signal` or `BundleInstance`."""
 
-        # Get the target Module's port-object corresponding to `portref`
-        io_dict: Dict[str, Connectable] = io(portref.inst._resolved)
-        port = io_dict.get(portref.portname, None)
-        if port is None:
-            msg = f"Invalid port connection to `{portref}` in Module `{module}`"
-            self.fail(msg)
-
-        # Copy any relevant attributes of the Port
-        sig = self.copy_port(port)
-
-        # Set the signal name, either from the NoConn or the instance/port names
-        if noconn.name is not None:
-            sig.name = noconn.name
-        else:
-            sig.name = self.flatname(
-                segments=[f"{portref.inst.name}_{portref.portname}"],
-                avoid=module.namespace,
-            )
-
-        # Add the new signal, and connect it to `inst`
-        module.add(sig)
+        # Create the new signal, named either from the NoConn or the instance/port names
+        sig = self.add_port_copy(module, portref, name=noconn.name)
+        # And connect it to `inst`
         portref.inst.connect(portref.portname, sig)
 
 
-class SetList:
-    """A common combination of a hash-set and ordered list of the same items.
-    Used for keeping ordered items while maintaining quick membership testing.
+class DisjointSets:
+    """
+    # Disjoint Sets
+    A "union-find" forest, with path compression and union-by-rank.
+    Used for grouping connected `PortRef`s and their `Source`s into nets.
 
-    FIXME: this is really using a LIST for now, slowing down membership tests,
-    but should be set-based when some connectable types, particularly `Signal`, are ready for it.
+    `PortRef`s are keyed by value, i.e. by their Instance and port-name, consistent with their `__eq__`.
+    All other items are keyed by identity.
     """
 
     def __init__(self):
-        # self.set = set()
-        self.list = list()
-
-    def __bool__(self):
-        return bool(self.list)
-
-    def __contains__(self, item):
-        # return item in self.set
-        return item in self.list
-
-    def add(self, item):
-        # if item not in self.set:
-        if item not in self.list:
-            # self.set.add(item)
-            self.list.append(item)
-
-    def remove(self, item):
-        # if item not in self.set:
-        if item not in self.list:
-            raise RuntimeError
-            # self.set.add(item)
-        self.list.remove(item)
-
-    def pop(self):
-        # if item not in self.set:
-        if not self.list:
-            raise RuntimeError
-            # self.set.add(item)
-        return self.list.pop(0)
-
-    @property
-    def order(self):
-        return self.list
+        self.items: Dict[Hashable, Any] = dict()  # {key => item}, in insertion order
+        self.parent: Dict[Hashable, Hashable] = dict()  # {key => parent key}
+        self.rank: Dict[Hashable, int] = dict()  # {root key => rank}
+
+    @staticmethod
+    def key(item: Any) -> Hashable:
+        if isinstance(item, PortRef):
+            return (id(item.inst), item.portname)
+        return id(item)
+
+    def add(self, item: Any) -> Hashable:
+        """Add `item` as a new single-element set, if not already present. Returns its key."""
+        key = self.key(item)
+        if key not in self.parent:
+            self.items[key] = item
+            self.parent[key] = key
+            self.rank[key] = 0
+        return key
+
+    def find(self, key: Hashable) -> Hashable:
+        """Find the root key of the set containing `key`, compressing its path along the way."""
+        root = key
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[key] != root:
+            self.parent[key], key = root, self.parent[key]
+        return root
+
+    def union(self, a: Any, b: Any) -> None:
+        """Merge the sets containing items `a` and `b`, adding either if necessary."""
+        ra = self.find(self.add(a))
+        rb = self.find(self.add(b))
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+
+    def groups(self) -> List[List[Any]]:
+        """Get a list of all sets, each as a list of items.
+        Both the sets and their items are ordered by (first) insertion."""
+        groups: Dict[Hashable, List[Any]] = dict()
+        for key, item in self.items.items():
+            groups.setdefault(self.find(key), list()).append(item)
+        return list(groups.values())
 
 
 def resolve_portref(pref: PortRef, to: Connectable) -> None:
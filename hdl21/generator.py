@@ -3,7 +3,7 @@
 """
 
 import inspect
-from typing import Callable, Any, Optional, Dict
+from typing import Callable, Any, Optional, Dict, Tuple
 
 # Local imports
 from .default import Default
@@ -71,6 +71,8 @@ class GeneratorCall:
         self._source_info: Optional[SourceInfo] = source_info(get_pymodule=False)
         # The source/ parent `GeneratorCall`, for nested Generator calls
         self._generated_by: Optional["GeneratorCall"] = None
+        # Elaboration cache-key, computed and set on first elaboration
+        self._cache_key: Optional[Tuple[Generator, str]] = None
 
     def __eq__(self, other) -> bool:
         """Generator-Call equality requires:
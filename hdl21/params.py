@@ -3,6 +3,7 @@ Hdl21 Parameters and Param-Classes
 """
 
 from typing import Optional, Union, Any, Dict
+from enum import Enum
 import dataclasses
 import json
 import pickle
@@ -122,10 +123,40 @@ class Param:
 
 
 def _unique_name(params: Any) -> str:
-    """Create a unique name for parameter-class instance `params`"""
+    """Create a unique name for parameter-class instance `params`.
+
+    `paramclass`es are frozen, but their container-valued fields (lists, dicts, etc.) can still be modified in-place.
+    The result is therefore cached on `params` only if all of its field-values are immutable,
+    i.e. scalars, and tuples and nested `paramclass`es thereof. Otherwise it is recomputed on each call."""
     if not isparamclass(params):
         raise RuntimeError(f"Invalid parameter-class instance {params}")
 
+    cached = getattr(params, "_unique_name_cache", None)
+    if cached is not None:
+        return cached
+
+    name = _compute_unique_name(params)
+    if _is_immutable(params):
+        # Note `paramclass`es are frozen, so setting the cache requires `object.__setattr__`.
+        object.__setattr__(params, "_unique_name_cache", name)
+    return name
+
+
+def _is_immutable(val: Any) -> bool:
+    """Boolean indication of whether `val` is (recursively) immutable,
+    and hence whether its `_unique_name` can be cached."""
+    if val is None or isinstance(val, (str, int, float, complex, bytes, Enum)):
+        return True
+    if isinstance(val, (tuple, frozenset)):
+        return all(_is_immutable(v) for v in val)
+    if isparamclass(val):
+        return all(_is_immutable(getattr(val, k)) for k in val.__params__)
+    return False
+
+
+def _compute_unique_name(params: Any) -> str:
+    """Inner implementation of `_unique_name`, without caching."""
+
     # Determine whether *all* fields of `params` are scalar values: strings, numbers, and options thereof
     scalars = [
         str,
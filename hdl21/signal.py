@@ -20,7 +20,6 @@ and direction. For internal `Signals`, the `direction` field is globally expecte
 
 """
 
-from copy import copy
 from enum import Enum
 from dataclasses import field
 from typing import Callable, Optional, List, Set
@@ -136,32 +135,48 @@ class Signal:
         # Identity is equality
         return hash(id(self))
 
-    def __copy__(self) -> "Signal":
+    def clone(self) -> "Signal":
         """Signal copying implementation
         Keeps "public" fields such as name and width,
-        while dropping "per-module" fields such as `_slices`."""
+        while dropping "per-module" fields such as `_slices`.
+
+        Skips the constructor's field-validation, since each copied field
+        has already been validated on `self`."""
         # Notably `_parent_module` *is not* copied.
         # It will generally be set when the copy is added to any new Module.
-        return Signal(
+        sig = Signal.__new__(Signal)
+        sig.__dict__.update(
             name=self.name,
             width=self.width,
             vis=self.vis,
             direction=self.direction,
+            usage=Usage.SIGNAL,
+            props=Properties(),
             desc=self.desc,
             src=self.src,
             dest=self.dest,
+            related_clk=None,
+            related_pwr=None,
+            related_gnd=None,
+            __initialised__=True,
         )
+        sig.__post_init_post_parse__()
+        return sig
+
+    def __copy__(self) -> "Signal":
+        """Signal copies. See `clone`."""
+        return self.clone()
 
     def __deepcopy__(self, _memo) -> "Signal":
         """Signal "deep" copies"""
         # The same as shallow ones; there is no "deep" data being copied.
-        return self.__copy__()
+        return self.clone()
 
     def __rmul__(self, num: int) -> List["Signal"]:
         """# Right multiplication. Creates `num` copies of this Signal."""
         if not isinstance(num, int):
             return NotImplemented
-        return [copy(self) for _ in range(num)]
+        return [self.clone() for _ in range(num)]
 
 
 """
@@ -248,7 +263,7 @@ def _pluralize(fn: Callable):
 
 def _copy_to_internal(sig: Signal) -> Signal:
     """Make a copy of `sig`, replacing its visibility and port-direction to be internal."""
-    sig = copy(sig)
+    sig = sig.clone()
     sig.vis = Visibility.INTERNAL
     sig.direction = PortDir.NONE
     sig._parent_module = None
@@ -661,6 +661,19 @@ def test_copy_signal():
     copy.copy(h.Signal())
     copy.deepcopy(h.Signal())
 
+    m = h.Module(name="m")
+    m.p = h.Output(width=3, desc="p")
+    c = m.p.clone()
+    assert c is not m.p
+    assert c.name == "p"
+    assert c.width == 3
+    assert c.vis == h.Visibility.PORT
+    assert c.direction == h.PortDir.OUTPUT
+    assert c.desc == "p"
+    assert c._parent_module is None
+    assert c._connected_ports == set()
+    assert c._connected_ports is not m.p._connected_ports
+
 
 def test_orphanage():
     """Test that orphaned Module-attributes fail at elaboration"""
@@ -801,6 +814,92 @@ def test_elab_noconn2():
     assert len(M1.signals) == 1
 
 
+def test_elab_module_once_per_pass():
+    """Test that each elaborator pass visits each Module once, no matter how many times it is instantiated"""
+    from hdl21.elab.elaborators.base import Elaborator
+
+    visits = []
+
+    class CountingPass(Elaborator):
+        def elaborate_module(self, module: h.Module) -> h.Module:
+            visits.append(module.name)
+            return module
+
+    @h.module
+    class Leaf:
+        p = h.Port()
+
+    @h.module
+    class Mid:
+        p = h.Port()
+        l0 = Leaf(p=p)
+        l1 = Leaf(p=p)
+
+    @h.module
+    class Top:
+        p = h.Signal()
+        m0 = Mid(p=p)
+        m1 = Mid(p=p)
+
+    h.elaborate(Top, passes=[CountingPass])
+    assert visits == ["Leaf", "Mid", "Top"]
+
+
+def test_elab_custom_pass_not_fused():
+    """Test that custom passes see the entire hierarchy as left by the passes before them,
+    i.e. that they are not fused with the built-in passes which follow them."""
+    from hdl21.elab.elaborators.base import Elaborator
+    from hdl21.elab import ElabPass
+
+    seen = []
+
+    class SeesBundlePorts(Elaborator):
+        def elaborate_module(self, module: h.Module) -> h.Module:
+            for inst in module.instances.values():
+                seen.append(list(inst._resolved.bundle_ports.keys()))
+            return module
+
+    @h.bundle
+    class B:
+        s = h.Signal()
+
+    @h.module
+    class Inner:
+        bp = B(port=True)
+
+    @h.module
+    class Outer:
+        b = B()
+        i = Inner(bp=b)
+
+    passes = ElabPass.default()
+    idx = passes.index(ElabPass.FLATTEN_BUNDLES)
+    passes.insert(idx, SeesBundlePorts)
+    h.elaborate(Outer, passes=passes)
+    assert seen == [["bp"]]
+
+
+def test_elab_primitive_call_override():
+    """Test that passes which override `elaborate_primitive_call` still visit each `PrimitiveCall`"""
+    from hdl21.elab.elaborators.base import Elaborator
+
+    visits = []
+
+    class PrimPass(Elaborator):
+        def elaborate_primitive_call(self, call):
+            visits.append(call)
+            return call
+
+    @h.module
+    class HasPrims:
+        p = h.Signal()
+        r = h.primitives.R(r=1)(p=p, n=p)
+        c = h.primitives.C(c=1)(p=p, n=p)
+
+    h.elaborate(HasPrims, passes=[PrimPass])
+    assert len(visits) == 2
+
+
 def test_bad_noconn():
     """Test that a doubly-connected `NoConn` should fail"""
 
@@ -824,6 +923,53 @@ def test_bad_noconn():
         h.elaborate(Bad)
 
 
+def test_bad_noconn2():
+    """Test that a `NoConn` shared between two Instances, each also connected via `PortRef`, fails"""
+
+    @h.module
+    class Inner:
+        p = h.Port()
+
+    @h.module
+    class Bad:
+        i1 = Inner()
+        i2 = Inner()
+        i3 = Inner()
+
+        # Connect the same `NoConn` to two Instances
+        n = h.NoConn()
+        i1.p = n
+        i2.p = n
+        # And connect a third Instance to the first
+        i3.p = i1.p
+
+    with pytest.raises(RuntimeError):
+        h.elaborate(Bad)
+
+
+def test_portref_branches():
+    """Test a `PortRef` connected to several others resolves to a single Signal"""
+
+    @h.module
+    class Inner:
+        p = h.Port()
+
+    @h.module
+    class HasBranches:
+        i0 = Inner()
+        i1 = Inner(p=i0.p)
+        i2 = Inner(p=i0.p)
+        i3 = Inner(p=i1.p)
+        i4 = Inner(p=i3.p)
+
+    h.elaborate(HasBranches)
+
+    assert len(HasBranches.signals) == 1
+    sig = HasBranches.signals["i0_p"]
+    for inst in HasBranches.instances.values():
+        assert inst.conns["p"] is sig
+
+
 def test_array_concat_conn():
     """Test connecting a `Concat` to an `InstanceArray`"""
 
@@ -1217,6 +1363,36 @@ def test_generator_eq():
     assert hash(Gen()) == hash(Gen(p=111))
 
 
+def test_generator_cache_unique_name_collision():
+    """Test that Generator calls with un-equal parameters, but equal unique-names, produce different Modules."""
+    from typing import Optional
+
+    @h.paramclass
+    class P:
+        s = h.Param(dtype=Optional[str], desc="s", default=None)
+
+    @h.generator
+    def G(p: P) -> h.Module:
+        m = h.Module()
+        if p.s is None:
+            m.none = h.Input()
+        else:
+            m.some = h.Input()
+        return m
+
+    assert h.params._unique_name(P(s=None)) == h.params._unique_name(P(s="None"))
+
+    m1 = h.elaborate(G(P(s=None)))
+    m2 = h.elaborate(G(P(s="None")))
+    assert m1 is not m2
+    assert "none" in m1.ports
+    assert "some" in m2.ports
+
+    # And equal parameters still hit the cache
+    assert h.elaborate(G(P(s=None))) is m1
+    assert h.elaborate(G(P(s="None"))) is m2
+
+
 def test_param_calls():
     """ " Test creation of `Primitive`s and `ExternalModule` calls with inline construction of their parameters."""
 
@@ -96,6 +96,29 @@ def test_params4():
     assert uname1 == uname2
     assert uname1 == "3dcc309796996b3a8a61db66631c5a93"
 
+    # Check the unique name is cached, and does not impact equality
+    assert o1._unique_name_cache == uname1
+    assert h.params._unique_name(o1) is uname1
+    assert o1 == Outer(**d1)
+    assert asdict(o1) == d1
+
+
+def test_unique_name_mutable_fields():
+    # Test that `_unique_name` is not cached for params with mutable (e.g. list) fields
+
+    @h.paramclass
+    class HasList:
+        l = h.Param(dtype=list, desc="A mutable list")
+
+    p = HasList(l=[1, 2, 3])
+    uname1 = h.params._unique_name(p)
+    assert getattr(p, "_unique_name_cache", None) is None
+
+    # Modify the list in-place, and check the name changes along with it
+    p.l.append(4)
+    assert h.params._unique_name(p) != uname1
+    assert h.params._unique_name(p) == h.params._unique_name(HasList(l=[1, 2, 3, 4]))
+
 
 def test_bad_params1():
     # Test a handful of errors Params and paramclasses should raise.